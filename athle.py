@@ -1,11 +1,19 @@
 import streamlit as st
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+from selectolax.lexbor import LexborHTMLParser
 import re
+import hashlib
+from io import BytesIO
 from datetime import datetime, timedelta
 import time
-from typing import Optional, List
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Dict, Optional, List, Tuple
 
 # Set page config
 st.set_page_config(
@@ -18,6 +26,46 @@ st.set_page_config(
 BASE_URL = "https://www.athle.fr/bases/liste.aspx"
 COMPETITIONS_PER_PAGE = 250
 DEFAULT_DELAY = 1.0
+DETAIL_WORKERS = 8
+PROGRESS_UPDATE_PAGES = 3
+CACHE_NAME = "athle_cache"
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+# ================== REGEX PATTERNS ==================
+_RE_ID = re.compile(r'numéro\s*:\s*(\d+)', re.IGNORECASE)
+_RE_JS_URL = re.compile(r"'(https?://[^']+)'")
+_RE_WINDOW_OPEN = re.compile(r'window\.open\(\'([^\']+)\'')
+_RE_COMPETITION_PATH = re.compile(r'/(competition|competitions)/[^\'"]+')
+_RE_EMAIL = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_RE_EMAIL_LINE = re.compile(r'Email\s*[:\-]?\s*([\w\.-]+@[\w\.-]+\.\w+)', re.IGNORECASE)
+_RE_CODE = re.compile(r'Code compétition\s*:\s*(\d+)')
+_RE_CONTACT = re.compile(r'Personnes à contacter.*\n*(.+)')
+_RE_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# ================== DETAIL PAGE LABELS ==================
+# Paragraph labels in the "infoPratique" section mapped to output fields.
+# Addresses and emails need extra checks and are handled separately.
+_DETAIL_MARKERS = (
+    ('Nom de l’organisateur', 'Organizer_Name'),
+    ('Nom de l\'organisateur', 'Organizer_Name'),
+    ('Téléphone', 'Organizer_Phone'),
+    ('Site internet', 'Organizer_Website'),
+)
+
+# ================== XPATH QUERIES ==================
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+_XP_INFO_SECTION = etree.XPath('(//section[@id="infoPratique"])[1]')
+_XP_MAILTO_HREFS = etree.XPath('.//a[contains(@href, "mailto:")]/@href')
+_XP_PARAGRAPHS = etree.XPath('.//p')
+_XP_VISIBLE_TEXT = etree.XPath('.//text()[not(ancestor::script or ancestor::style)]')
+_XP_CLUB_CARD = etree.XPath(f'(//div[{_has_class("club-card")}])[1]')
+_XP_EVENT_HEADERS = etree.XPath(
+    f'//section[@id="epreuves"]//div[{_has_class("club-card")}]'
+    f'/descendant::h3[{_has_class("text-normal")}][1]'
+)
 
 # ================== HEADERS ==================
 HEADERS = {
@@ -31,31 +79,76 @@ HEADERS = {
     'Sec-Fetch-Mode': 'navigate',
     'Sec-Fetch-Site': 'none',
     'Sec-Fetch-User': '?1',
-    'Cache-Control': 'max-age=0',
     'sec-ch-ua': '"Google Chrome";v="143", "Chromium";v="143", "Not A(Brand";v="24"',
     'sec-ch-ua-mobile': '?0',
     'sec-ch-ua-platform': '"Windows"'
 }
 
 # ================== SESSION MANAGEMENT ==================
-@st.cache_resource(ttl=1800)
+@st.cache_resource
 def get_session():
-    """Create and cache a requests session."""
-    session = requests.Session()
+    """Create and cache a requests session backed by a persistent HTTP cache."""
+    session = requests_cache.CachedSession(
+        CACHE_NAME,
+        backend='sqlite',
+        expire_after=CACHE_EXPIRE_AFTER,
+        # Listing results change as competitions are added; only detail pages are cached
+        urls_expire_after={'www.athle.fr/bases/liste.aspx': requests_cache.DO_NOT_CACHE},
+    )
+    # HEADERS must not carry Cache-Control: requests-cache honours it over expire_after
     session.headers.update(HEADERS)
+    # Retry transient server errors with backoff
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+    session.mount('https://', HTTPAdapter(max_retries=retries))
     return session
 
+# ================== RATE LIMITING ==================
+class RateLimiter:
+    """Thread-safe limiter spacing requests evenly at a global rate."""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+    
+    def acquire(self):
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next - now)
+            self._next = max(now, self._next) + 1 / self.rate
+        if wait:
+            time.sleep(wait)
+
+@st.cache_resource
+def get_rate_limiter():
+    """Create and cache the limiter shared by every request to athle.fr."""
+    return RateLimiter(1 / DEFAULT_DELAY)
+
 # ================== CORE SCRAPING FUNCTIONS ==================
+# Parsed detail pages keyed by a digest of the response body
+_parse_cache: Dict[bytes, dict] = {}
+
+def decode_body(response) -> str:
+    """Decode a response body with the encoding requests derived from its headers.
+    
+    requests only runs charset detection when no encoding could be derived; in that
+    case UTF-8 is assumed instead, so response.text's detection never runs.
+    """
+    encoding = response.encoding or 'utf-8'
+    try:
+        return response.content.decode(encoding, errors='replace')
+    except LookupError:
+        return response.content.decode('utf-8', errors='replace')
+
 def scrape_page(_session, params: dict, page: int):
     """Scrape a single page of competitions."""
     try:
-        params_with_page = params.copy()
-        params_with_page['frmposition'] = str(page)
-        
-        response = _session.get(BASE_URL, params=params_with_page, timeout=30)
+        get_rate_limiter().acquire()
+        response = _session.get(BASE_URL, params={**params, 'frmposition': str(page)}, timeout=30)
         response.raise_for_status()
         
-        competitions = parse_competitions(response.text, page)
+        competitions = parse_competitions(decode_body(response), page)
         return competitions, True
     except Exception as e:
         st.error(f"Error scraping page {page}: {str(e)}")
@@ -63,74 +156,70 @@ def scrape_page(_session, params: dict, page: int):
 
 def parse_competitions(html: str, page: int) -> List[dict]:
     """Parse competitions from HTML."""
-    soup = BeautifulSoup(html, 'html.parser')
+    tree = LexborHTMLParser(html)
     competitions = []
     
-    # Find all table rows that contain competition data
-    rows = soup.find_all('tr')
+    # Competition rows are the highlighted rows of the listing table
+    rows = tree.css('tr.clignotant')
     
     for row in rows:
-        # Get all cells in the row
-        cells = row.find_all('td')
+        # Take the row's own cells only, stopping once the seven we use are found
+        cells = list(islice((node for node in row.iter() if node.tag == 'td'), 7))
         if len(cells) < 7:
             continue
+        date_cell, event_cell, location_cell, type_cell, level_cell, _, detail_cell = cells
         
         # Check if this is a competition row by looking for date link
-        date_cell = cells[0]
-        date_link = date_cell.find('a')
+        date_link = date_cell.css_first('a')
         if not date_link:
             continue
         
         # Extract competition ID from title attribute
         competition_id = ""
-        title_attr = date_link.get('title', '')
-        id_match = re.search(r'numéro\s*:\s*(\d+)', title_attr, re.IGNORECASE)
+        title_attr = date_link.attributes.get('title') or ''
+        id_match = _RE_ID.search(title_attr)
         if id_match:
             competition_id = id_match.group(1)
         
         # Extract date
-        date = date_link.get_text(strip=True)
+        date = date_link.text(strip=True)
         
         # Extract other fields
-        event = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-        location = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-        competition_type = cells[3].get_text(strip=True) if len(cells) > 3 else ""
-        level = cells[4].get_text(strip=True) if len(cells) > 4 else ""
+        event = event_cell.text(strip=True)
+        location = location_cell.text(strip=True)
+        competition_type = type_cell.text(strip=True)
+        level = level_cell.text(strip=True)
         
-        # Extract detail URL - CRITICAL FIX HERE
+        # Extract detail URL from the 7th cell
         detail_url = ""
+        detail_link = detail_cell.css_first('a')
         
-        # Look for detail link in the 7th cell (index 6)
-        if len(cells) >= 7:
-            detail_cell = cells[6]
-            detail_link = detail_cell.find('a')
+        if detail_link:
+            href = detail_link.attributes.get('href') or ''
             
-            if detail_link:
-                href = detail_link.get('href', '')
-                
-                # Clean up the URL
-                if href:
-                    # Remove javascript: prefix if present
-                    if href.startswith('javascript:'):
-                        # Try to extract URL from javascript
-                        url_match = re.search(r"'(https?://[^']+)'", href)
+            # Clean up the URL
+            if href:
+                # Remove javascript: prefix if present
+                if href.startswith('javascript:'):
+                    # Try to extract URL from javascript
+                    url_match = _RE_JS_URL.search(href)
+                    if url_match:
+                        detail_url = url_match.group(1)
+                    else:
+                        # Try other patterns
+                        url_match = _RE_WINDOW_OPEN.search(href)
                         if url_match:
                             detail_url = url_match.group(1)
                         else:
-                            # Try other patterns
-                            url_match = re.search(r'window\.open\(\'([^\']+)\'', href)
+                            url_match = _RE_COMPETITION_PATH.search(href)
                             if url_match:
-                                detail_url = url_match.group(1)
-                            else:
-                                url_match = re.search(r'/(competition|competitions)/[^\'"]+', href)
-                                if url_match:
-                                    detail_url = f"https://www.athle.fr{url_match.group(0)}"
-                    elif href.startswith('/'):
-                        # Handle relative URLs
-                        detail_url = f"https://www.athle.fr{href}"
-                    elif href.startswith('http'):
-                        # Already a full URL
-                        detail_url = href
+                                detail_url = f"https://www.athle.fr{url_match.group(0)}"
+                elif href.startswith('/'):
+                    # Handle relative URLs
+                    detail_url = f"https://www.athle.fr{href}"
+                elif href.startswith('http'):
+                    # Already a full URL
+                    detail_url = href
         
         # If still no URL, try to construct from competition ID
         if not detail_url and competition_id:
@@ -167,6 +256,7 @@ def scrape_competitions(_session, params: dict, batch_mode: bool, batch_days: in
                         progress_bar=None, status_text=None) -> List[dict]:
     """Scrape all competitions based on parameters."""
     all_competitions = []
+    running_total = 0
     
     if batch_mode:
         # Parse dates
@@ -174,18 +264,18 @@ def scrape_competitions(_session, params: dict, batch_mode: bool, batch_days: in
         end_dt = datetime.strptime(params['frmdate2'], "%Y-%m-%d")
         current_start = start_dt
         batch_idx = 1
+        # Each batch covers batch_days + 1 calendar days
+        total_batches = (end_dt - start_dt).days // (batch_days + 1) + 1
         
         while current_start <= end_dt:
             current_end = min(current_start + timedelta(days=batch_days), end_dt)
             batch_start_str = current_start.strftime("%Y-%m-%d")
             batch_end_str = current_end.strftime("%Y-%m-%d")
             
-            batch_params = params.copy()
-            batch_params['frmdate1'] = batch_start_str
-            batch_params['frmdate2'] = batch_end_str
+            batch_params = {**params, 'frmdate1': batch_start_str, 'frmdate2': batch_end_str}
             
             if status_text:
-                status_text.text(f"Processing batch {batch_idx}: {batch_start_str} to {batch_end_str}")
+                status_text.text(f"Processing batch {batch_idx}/{total_batches}: {batch_start_str} to {batch_end_str}")
             
             page = 1
             while True:
@@ -194,24 +284,29 @@ def scrape_competitions(_session, params: dict, batch_mode: bool, batch_days: in
                     break
                 
                 all_competitions.extend(competitions)
+                page_count = len(competitions)
+                running_total += page_count
+                last_page = page_count < COMPETITIONS_PER_PAGE
                 
-                if status_text:
-                    status_text.text(f"Batch {batch_idx}, Page {page}: {len(competitions)} competitions (Total: {len(all_competitions)})")
-                
-                if progress_bar:
-                    progress_val = min(len(all_competitions) / 1000, 1.0)
-                    progress_bar.progress(progress_val)
+                if status_text and page % PROGRESS_UPDATE_PAGES == 0:
+                    status_text.text(f"Batch {batch_idx}/{total_batches}, Page {page}: {page_count} competitions (Total: {running_total})")
                 
-                if len(competitions) < COMPETITIONS_PER_PAGE:
+                if last_page:
                     break
                 
                 page += 1
-                time.sleep(DEFAULT_DELAY)
+            
+            # Throttled updates may have skipped the batch's final pages
+            if status_text:
+                status_text.text(f"Batch {batch_idx}/{total_batches} done (Total: {running_total})")
+            
+            if progress_bar:
+                progress_bar.progress(min(batch_idx / total_batches, 1.0))
             
             current_start = current_end + timedelta(days=1)
             batch_idx += 1
     else:
-        # Normal mode
+        # Normal mode: the total is unknown, so progress is an estimate
         page = 1
         while True:
             competitions, success = scrape_page(_session, params, page)
@@ -219,112 +314,144 @@ def scrape_competitions(_session, params: dict, batch_mode: bool, batch_days: in
                 break
             
             all_competitions.extend(competitions)
+            page_count = len(competitions)
+            running_total += page_count
+            last_page = page_count < COMPETITIONS_PER_PAGE
             
-            if status_text:
-                status_text.text(f"Page {page}: {len(competitions)} competitions (Total: {len(all_competitions)})")
-            
-            if progress_bar:
-                progress_val = min(len(all_competitions) / 1000, 1.0)
-                progress_bar.progress(progress_val)
+            if page % PROGRESS_UPDATE_PAGES == 0:
+                if status_text:
+                    status_text.text(f"Page {page}: {page_count} competitions (Total: {running_total})")
+                
+                if progress_bar:
+                    progress_bar.progress(min(running_total / 1000, 1.0))
             
-            if len(competitions) < COMPETITIONS_PER_PAGE:
+            if last_page:
                 break
             
             page += 1
-            time.sleep(DEFAULT_DELAY)
+        
+        # Throttled updates may have skipped the final pages
+        if status_text:
+            status_text.text(f"Done: {running_total} competitions")
+        
+        if progress_bar:
+            progress_bar.progress(min(running_total / 1000, 1.0))
     
     return all_competitions
 
-def scrape_detail_page(_session, url: str) -> Optional[dict]:
-    """Scrape a single detail page."""
+def scrape_detail_page(_session, url: str, limiter=None) -> Optional[dict]:
+    """Scrape a single detail page. Request errors propagate to the caller.
+    
+    Only requests that miss the HTTP cache wait for the limiter, if one is given.
+    """
     if not url or 'www..fr' in url:  # Skip malformed URLs
         return None
     
-    try:
+    # requests-cache answers 504 when the page is not cached (or has expired)
+    response = _session.get(url, timeout=30, only_if_cached=True)
+    if response.status_code == 504:
+        if limiter:
+            limiter.acquire()
         response = _session.get(url, timeout=30)
-        response.raise_for_status()
-        return parse_detail_page(response.text)
-    except Exception as e:
-        st.warning(f"Error scraping detail page {url}: {str(e)[:100]}")
-        return None
+    response.raise_for_status()
+    
+    # Identical bodies (e.g. a page listed in two overlapping batches) are parsed once
+    key = hashlib.blake2b(response.content, digest_size=16).digest()
+    cached = _parse_cache.get(key)
+    if cached is None:
+        cached = _parse_cache[key] = parse_detail_page(decode_body(response))
+    return dict(cached)
+
+def _extract_email(info_section, email_values: List[str], paragraph_texts: List[str]) -> str:
+    """Return the organizer email from the first extraction method that finds one."""
+    # Method 1: Look for email in mailto links
+    for href in _XP_MAILTO_HREFS(info_section):
+        email = href.replace('mailto:', '').strip()
+        if email:
+            return email
+    
+    # Method 2: Values of the "Email" paragraphs
+    for value in email_values:
+        email_match = _RE_EMAIL.search(value)
+        if email_match:
+            return email_match.group(0)
+        if value and value != '-':
+            return value
+    
+    # Method 3: Fallback regex over the paragraph texts
+    email_match = _RE_EMAIL_LINE.search('\n'.join(paragraph_texts))
+    return email_match.group(1).strip() if email_match else ''
+
+def _stripped_text(element) -> str:
+    """Visible text of element with each string stripped, like get_text(strip=True)."""
+    return ''.join(t.strip() for t in _XP_VISIBLE_TEXT(element))
+
+def _html_tree(html: str):
+    """Build an lxml tree, falling back to an empty document for blank bodies."""
+    # The body is already decoded, so an XML encoding declaration is moot and
+    # would make lxml reject the str
+    html = _RE_XML_DECLARATION.sub('', html, count=1)
+    if html.strip():
+        try:
+            return lxml_html.fromstring(html)
+        except etree.ParserError:
+            pass
+    return etree.Element('html')
 
 def parse_detail_page(html: str) -> dict:
     """Parse detail page HTML."""
-    soup = BeautifulSoup(html, 'html.parser')
+    tree = _html_tree(html)
     detail_data = {}
     
     # Extract organizer information
-    info_section = soup.find('section', {'id': 'infoPratique'})
-    if info_section:
-        # Method 1: Look for email in mailto links
-        mailto_links = info_section.find_all('a', href=lambda x: x and 'mailto:' in x)
-        for link in mailto_links:
-            email = link.get('href', '').replace('mailto:', '').strip()
-            if email:
-                detail_data['Organizer_Email'] = email
-                break
+    info_sections = _XP_INFO_SECTION(tree)
+    info_section = info_sections[0] if info_sections else None
+    if info_section is not None:
+        paragraph_texts = []
+        email_values = []
         
-        # Method 2: Parse paragraph by paragraph
-        paragraphs = info_section.find_all('p')
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            
-            if 'Nom de l’organisateur' in text or 'Nom de l\'organisateur' in text:
-                detail_data['Organizer_Name'] = text.split(':', 1)[1].strip() if ':' in text else ''
-            
-            elif 'Adresse' in text and 'stade' not in text.lower():
-                detail_data['Organizer_Address'] = text.split(':', 1)[1].strip() if ':' in text else ''
-            
-            elif 'Téléphone' in text:
-                detail_data['Organizer_Phone'] = text.split(':', 1)[1].strip() if ':' in text else ''
+        # Parse paragraph by paragraph
+        for p in _XP_PARAGRAPHS(info_section):
+            text = _stripped_text(p)
+            paragraph_texts.append(text)
+            label, sep, value = text.partition(':')
+            if not sep:
+                continue
+            value = value.strip()
             
-            elif 'Email' in text and 'Organizer_Email' not in detail_data:
-                email_text = text.split(':', 1)[1].strip() if ':' in text else ''
-                email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', email_text)
-                if email_match:
-                    detail_data['Organizer_Email'] = email_match.group(0)
-                elif email_text and email_text != '-':
-                    detail_data['Organizer_Email'] = email_text
+            if 'Adresse' in label:
+                if 'stade' not in label.lower():
+                    detail_data['Organizer_Address'] = value
+                elif 'Adresse du stade' in label:
+                    detail_data['Stadium_Address'] = value
             
-            elif 'Site internet' in text:
-                website = text.split(':', 1)[1].strip() if ':' in text else ''
-                if website and website != '-':
-                    detail_data['Organizer_Website'] = website
+            elif 'Email' in label:
+                email_values.append(value)
             
-            elif 'Adresse du stade' in text:
-                detail_data['Stadium_Address'] = text.split(':', 1)[1].strip() if ':' in text else ''
-    
-    # Method 3: Fallback regex for email
-    if 'Organizer_Email' not in detail_data or not detail_data['Organizer_Email']:
-        if info_section:
-            section_text = info_section.get_text()
-            email_match = re.search(r'Email\s*[:\-]?\s*([\w\.-]+@[\w\.-]+\.\w+)', section_text, re.IGNORECASE)
-            if email_match:
-                detail_data['Organizer_Email'] = email_match.group(1).strip()
+            else:
+                for marker, field in _DETAIL_MARKERS:
+                    if marker in label:
+                        if value != '-' or field != 'Organizer_Website':
+                            detail_data[field] = value
+                        break
+        
+        detail_data['Organizer_Email'] = _extract_email(info_section, email_values, paragraph_texts)
     
     # Extract competition code
-    club_card = soup.find('div', class_='club-card')
-    if club_card:
-        card_text = club_card.get_text(separator='\n', strip=True)
+    club_cards = _XP_CLUB_CARD(tree)
+    if club_cards:
+        card_text = '\n'.join(t.strip() for t in _XP_VISIBLE_TEXT(club_cards[0]) if t.strip())
         
-        code_match = re.search(r'Code compétition\s*:\s*(\d+)', card_text)
+        code_match = _RE_CODE.search(card_text)
         if code_match:
             detail_data['Competition_Code'] = code_match.group(1).strip()
         
-        contact_match = re.search(r'Personnes à contacter.*\n*(.+)', card_text)
+        contact_match = _RE_CONTACT.search(card_text)
         if contact_match:
             detail_data['Contact_Person'] = contact_match.group(1).strip()[:100]
     
-    # Extract events list
-    events_section = soup.find('section', {'id': 'epreuves'})
-    events_list = []
-    if events_section:
-        event_cards = events_section.find_all('div', class_='club-card')
-        for card in event_cards:
-            header = card.find('h3', class_='text-normal')
-            if header:
-                event_name = header.get_text(strip=True)
-                events_list.append(event_name)
+    # Extract events list (first event header of each card)
+    events_list = [_stripped_text(header) for header in _XP_EVENT_HEADERS(tree)]
     
     detail_data['Events_List'] = '; '.join(events_list)
     detail_data['Events_Count'] = len(events_list)
@@ -341,47 +468,64 @@ def parse_detail_page(html: str) -> dict:
     
     return detail_data
 
-def scrape_detail_pages(_session, competitions: List[dict], progress_bar=None, status_text=None) -> List[dict]:
-    """Scrape detail pages for all competitions."""
+def scrape_detail_pages(_session, competitions: List[dict], progress_bar=None,
+                        status_text=None) -> Tuple[List[dict], int]:
+    """Scrape detail pages for all competitions using a pool of worker threads.
+    
+    Returns the updated competitions and how many of them have an organizer email.
+    """
+    email_count = 0
     if not competitions:
-        return competitions
+        return competitions, email_count
     
     if status_text:
         status_text.text(f"Starting detail page scraping for {len(competitions)} competitions...")
     
-    updated_competitions = []
-    for idx, comp in enumerate(competitions):
-        if not comp.get('Detail_URL') or 'www..fr' in comp.get('Detail_URL', ''):
-            updated_competitions.append(comp)
-            continue
-            
-        if status_text:
-            event_name = comp.get('Event', '')[:30] + '...' if len(comp.get('Event', '')) > 30 else comp.get('Event', '')
-            status_text.text(f"Scraping detail {idx + 1}/{len(competitions)}: {event_name}...")
-        
-        detail_data = scrape_detail_page(_session, comp['Detail_URL'])
-        if detail_data:
-            comp.update(detail_data)
-        
-        updated_competitions.append(comp)
-        
-        if progress_bar:
-            progress_val = (idx + 1) / len(competitions)
-            progress_bar.progress(progress_val)
-        
-        time.sleep(DEFAULT_DELAY)
+    limiter = get_rate_limiter()
     
-    return updated_competitions
+    # Streamlit elements may only be touched from the script thread, so workers
+    # just fetch and parse; results and errors are handled here as they arrive.
+    executor = ThreadPoolExecutor(max_workers=DETAIL_WORKERS)
+    futures = {
+        executor.submit(scrape_detail_page, _session, comp['Detail_URL'], limiter): comp
+        for comp in competitions
+        if comp.get('Detail_URL') and 'www..fr' not in comp['Detail_URL']
+    }
+    
+    try:
+        for done, future in enumerate(as_completed(futures), start=1):
+            comp = futures[future]
+            try:
+                detail_data = future.result()
+            except Exception as e:
+                st.warning(f"Error scraping detail page {comp['Detail_URL']}: {str(e)[:100]}")
+                detail_data = None
+            
+            if detail_data:
+                comp.update(detail_data)
+                if '@' in detail_data['Organizer_Email']:
+                    email_count += 1
+            
+            if status_text:
+                event_name = comp.get('Event', '')[:30] + '...' if len(comp.get('Event', '')) > 30 else comp.get('Event', '')
+                status_text.text(f"Scraped detail {done}/{len(futures)}: {event_name}")
+            
+            if progress_bar:
+                progress_bar.progress(done / len(futures))
+    except BaseException:
+        # A Streamlit stop or rerun must not wait for every queued page to be fetched
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    
+    return competitions, email_count
 
 # ================== DATA PROCESSING ==================
-@st.cache_data
 def create_final_dataframe(competitions: List[dict]) -> pd.DataFrame:
-    """Create final DataFrame with proper column ordering."""
+    """Create final DataFrame with proper column ordering and compact dtypes."""
     if not competitions:
         return pd.DataFrame()
     
-    df = pd.DataFrame(competitions)
-    
     # Define column order
     column_order = [
         'Competition_ID',
@@ -404,29 +548,35 @@ def create_final_dataframe(competitions: List[dict]) -> pd.DataFrame:
         'Page'
     ]
     
-    # Reorder columns
-    existing_cols = [col for col in column_order if col in df.columns]
-    df = df[existing_cols]
+    # Every competition dict carries the full schema, so build in order directly
+    df = pd.DataFrame.from_records(competitions, columns=column_order)
+    
+    # Low-cardinality columns are stored as categories
+    for column in ('Type', 'Level', 'Page'):
+        df[column] = df[column].astype('category')
+    df['Events_Count'] = df['Events_Count'].astype('int32')
     
     return df
 
 @st.cache_data
 def convert_to_csv(df: pd.DataFrame) -> bytes:
     """Convert DataFrame to CSV with proper encoding."""
-    return df.to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig')
+    output = BytesIO()
+    df.to_csv(output, index=False, encoding='utf-8-sig')
+    return output.getvalue()
 
 @st.cache_data
 def convert_to_excel(df: pd.DataFrame) -> bytes:
     """Convert DataFrame to Excel."""
-    from io import BytesIO
     output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
         df.to_excel(writer, index=False, sheet_name='Competitions')
         worksheet = writer.sheets['Competitions']
-        for column in df:
-            column_length = max(df[column].astype(str).map(len).max(), len(column))
-            col_idx = df.columns.get_loc(column)
-            worksheet.column_dimensions[chr(65 + col_idx)].width = min(column_length + 2, 50)
+        # Vectorized string lengths; missing values count as empty cells
+        max_lengths = {column: df[column].astype('string').str.len().max() for column in df.columns}
+        for col_idx, column in enumerate(df.columns):
+            max_length = 0 if pd.isna(max_lengths[column]) else int(max_lengths[column])
+            worksheet.set_column(col_idx, col_idx, min(max(max_length, len(column)) + 2, 50))
     
     return output.getvalue()
 
@@ -504,6 +654,7 @@ with tab1:
                         st.write(f"{i+1}. {url}")
                 
                 # Scrape detail pages if requested
+                email_count = 0
                 if scrape_details and competitions:
                     progress_bar.empty()
                     status_text.empty()
@@ -512,7 +663,7 @@ with tab1:
                     detail_status = st.empty()
                     
                     with st.spinner("Scraping detail pages..."):
-                        competitions = scrape_detail_pages(
+                        competitions, email_count = scrape_detail_pages(
                             session, competitions, detail_progress, detail_status
                         )
                     
@@ -531,7 +682,7 @@ with tab1:
                     valid_urls = df['Detail_URL'].apply(lambda x: isinstance(x, str) and x.startswith('http'))
                     st.metric("Valid URLs", valid_urls.sum())
                 with col3:
-                    st.metric("With Email", df['Organizer_Email'].str.contains('@').sum())
+                    st.metric("With Email", email_count)
                 
                 # Display data
                 st.subheader("📊 Competition Data Preview")
@@ -636,7 +787,7 @@ with tab2:
     
     ### Technical Details
     
-    - Built with Python, Streamlit, BeautifulSoup, and pandas
+    - Built with Python, Streamlit, selectolax, lxml, and pandas
     - Uses requests with proper headers and delays
     - Triple-method email extraction for reliability
     - Real-time progress updates
@@ -0,0 +1,260 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+import athle
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        body = b'<html><body><section id="infoPratique"></section></body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _CountingHandler.hits = 0
+    httpd = HTTPServer(('127.0.0.1', 0), _CountingHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    monkeypatch.setattr(athle, 'CACHE_NAME', str(tmp_path / 'athle_cache'))
+    athle.get_session.clear()
+    yield athle.get_session()
+    athle.get_session.clear()
+
+
+def test_detail_page_is_served_from_cache_on_second_fetch(server, session):
+    url = f"{server}/competitions/123"
+
+    first = session.get(url, timeout=5)
+    second = session.get(url, timeout=5)
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert _CountingHandler.hits == 1
+
+
+class _CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+
+
+def test_cached_detail_pages_skip_the_rate_limiter(server, session, monkeypatch):
+    limiter = _CountingLimiter()
+    monkeypatch.setattr(athle, 'get_rate_limiter', lambda: limiter)
+    urls = [f"{server}/competitions/{i}" for i in range(3)]
+
+    athle.scrape_detail_pages(session, [{'Detail_URL': url} for url in urls])
+    assert limiter.acquired == 3
+
+    athle.scrape_detail_pages(session, [{'Detail_URL': url} for url in urls])
+    assert limiter.acquired == 3
+    assert _CountingHandler.hits == 3
+
+
+class _StopOnFirstUpdate:
+    def text(self, message):
+        if message.startswith("Scraped detail"):
+            raise KeyboardInterrupt
+
+
+class _SlowLimiter:
+    def acquire(self):
+        time.sleep(0.05)
+
+
+def test_stopping_detail_scrape_cancels_queued_pages(server, session, monkeypatch):
+    monkeypatch.setattr(athle, 'get_rate_limiter', lambda: _SlowLimiter())
+    competitions = [{'Detail_URL': f"{server}/competitions/{i}"} for i in range(100)]
+
+    with pytest.raises(KeyboardInterrupt):
+        athle.scrape_detail_pages(session, competitions, status_text=_StopOnFirstUpdate())
+
+    time.sleep(0.5)
+    assert _CountingHandler.hits <= 2 * athle.DETAIL_WORKERS
+
+
+EMPTY_DETAIL = {
+    'Organizer_Name': '', 'Organizer_Address': '', 'Organizer_Phone': '',
+    'Organizer_Email': '', 'Organizer_Website': '', 'Stadium_Address': '',
+    'Competition_Code': '', 'Contact_Person': '', 'Events_List': '', 'Events_Count': 0,
+}
+
+
+@pytest.mark.parametrize('html', ['', '   \n', '<!-- nothing -->'])
+def test_parse_detail_page_returns_empty_record_for_blank_body(html):
+    assert athle.parse_detail_page(html) == EMPTY_DETAIL
+
+
+def test_parse_detail_page_accepts_xml_encoding_declaration():
+    html = ('<?xml version="1.0" encoding="iso-8859-1"?>'
+            '<html><body><section id="infoPratique"><p>Téléphone : 0102</p></section></body></html>')
+    assert athle.parse_detail_page(html)['Organizer_Phone'] == '0102'
+
+
+def test_parse_detail_page_ignores_script_text_in_club_card():
+    html = ('<html><body><div class="club-card">'
+            '<script>var s = "Code compétition : 1";</script><p>Code compétition : 42</p>'
+            '</div></body></html>')
+    assert athle.parse_detail_page(html)['Competition_Code'] == '42'
+
+
+LISTING_ROW = (
+    '<tr class="clignotant"><td><a title="numéro : {i}">01/01</a></td><td>e</td><td>l</td>'
+    '<td>t</td><td>L</td><td></td><td><a href="/competitions/{i}">x</a></td></tr>'
+)
+
+
+class _ListingResponse:
+    headers = {'Content-Type': 'text/html; charset=utf-8'}
+    encoding = 'utf-8'
+
+    def __init__(self, rows):
+        self.content = ('<table>' + ''.join(LISTING_ROW.format(i=i) for i in range(rows)) + '</table>').encode()
+
+    def raise_for_status(self):
+        pass
+
+
+class _ListingSession:
+    """Serves full pages until page 3, which comes back empty."""
+
+    def get(self, url, params=None, timeout=None):
+        page = int(params['frmposition'])
+        return _ListingResponse(athle.COMPETITIONS_PER_PAGE if page < 3 else 0)
+
+
+class _Recorder:
+    def __init__(self):
+        self.messages = []
+
+    def text(self, message):
+        self.messages.append(message)
+
+
+@pytest.mark.parametrize('batch_mode', [False, True])
+def test_final_listing_status_reports_the_full_total(monkeypatch, batch_mode):
+    monkeypatch.setattr(athle, 'get_rate_limiter', lambda: _CountingLimiter())
+    status = _Recorder()
+    params = {'frmdate1': '2026-01-01', 'frmdate2': '2026-01-10', 'frmposition': '1'}
+
+    competitions = athle.scrape_competitions(_ListingSession(), params, batch_mode, 30, status_text=status)
+
+    assert len(competitions) == 2 * athle.COMPETITIONS_PER_PAGE
+    assert str(len(competitions)) in status.messages[-1]
+
+
+def _response(body: bytes, content_type: str) -> requests.Response:
+    response = requests.Response()
+    response._content = body
+    response.headers['Content-Type'] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def test_decode_body_matches_response_text_without_declared_charset():
+    response = _response('<p>Téléphone : numéro</p>'.encode('latin-1'), 'text/html')
+
+    assert athle.decode_body(response) == response.text == '<p>Téléphone : numéro</p>'
+
+
+def test_decode_body_uses_declared_charset():
+    response = _response('<p>Téléphone</p>'.encode('utf-8'), 'text/html; charset=utf-8')
+
+    assert athle.decode_body(response) == '<p>Téléphone</p>'
+
+
+def test_decode_body_defaults_to_utf8_when_no_encoding_is_derived():
+    response = _response('<p>Téléphone</p>'.encode('utf-8'), 'application/octet-stream')
+
+    assert athle.decode_body(response) == '<p>Téléphone</p>'
+
+
+def test_shared_limiter_keeps_one_request_per_default_delay():
+    athle.get_rate_limiter.clear()
+
+    assert athle.get_rate_limiter().rate == 1 / athle.DEFAULT_DELAY
+
+
+DETAIL_PAGE = """<html><head><script>var x = 1;</script></head><body>
+<div class="club-card header">
+  <p>Code compétition : 261234</p>
+  <p>Personnes à contacter</p>
+  <p> Marie Martin </p>
+</div>
+<section id="infoPratique">
+  <p><b>Nom de l’organisateur</b> : AC Paris</p>
+  <p>Adresse : 12 rue des Sports<br/>75012 Paris</p>
+  <p>Adresse du stade : Stade Charléty</p>
+  <p>Téléphone :<span>01</span><span>02</span></p>
+  <p>Email : <a href="mailto:contact@acparis.fr">contact@acparis.fr</a></p>
+  <p>Site internet : -</p>
+  <p>Informations complémentaires</p>
+</section>
+<section id="epreuves">
+  <div class="club-card"><h3 class="text-normal">100 m <span>Cadets</span></h3>
+    <h3 class="text-normal">Not an event name</h3></div>
+  <div class="club-card"><h3 class="text-normal">Longueur</h3></div>
+  <div class="club-card"><p>No header</p></div>
+</section>
+</body></html>"""
+
+
+def test_parse_detail_page_extracts_every_field():
+    assert athle.parse_detail_page(DETAIL_PAGE) == {
+        'Organizer_Name': 'AC Paris',
+        'Organizer_Address': '12 rue des Sports75012 Paris',
+        'Organizer_Phone': '0102',
+        'Organizer_Email': 'contact@acparis.fr',
+        'Organizer_Website': '',
+        'Stadium_Address': 'Stade Charléty',
+        'Competition_Code': '261234',
+        'Contact_Person': 'Marie Martin',
+        'Events_List': '100 mCadets; Longueur',
+        'Events_Count': 2,
+    }
+
+
+def test_parse_detail_page_email_and_website_from_paragraphs():
+    html = """<html><body><section id="infoPratique">
+      <p>Nom de l'organisateur : Club B</p>
+      <p>Email : -</p>
+      <p>Email : ecrire à club.b@example.org svp</p>
+      <p>Site internet : https://club-b.example.org</p>
+    </section></body></html>"""
+
+    detail = athle.parse_detail_page(html)
+
+    assert detail['Organizer_Name'] == 'Club B'
+    assert detail['Organizer_Email'] == 'club.b@example.org'
+    assert detail['Organizer_Website'] == 'https://club-b.example.org'
+
+
+def test_parse_detail_page_email_falls_back_to_paragraph_regex():
+    html = """<html><body><section id="infoPratique">
+      <p>Contact Email secretariat@club-c.fr</p>
+    </section></body></html>"""
+
+    assert athle.parse_detail_page(html)['Organizer_Email'] == 'secretariat@club-c.fr'